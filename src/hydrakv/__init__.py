@@ -1,3 +1,3 @@
-from .client import Hydrakv
+from .client import Hydrakv, DBHandle
 
-__all__ = ["Hydrakv"]
+__all__ = ["Hydrakv", "DBHandle"]
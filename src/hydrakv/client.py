@@ -1,17 +1,100 @@
+import ssl
 import sys
-from asyncio import run
-from typing import Dict, Any
+from asyncio import run, gather, wait_for, TimeoutError as AsyncTimeoutError
+from typing import Dict, Any, List, Tuple, Awaitable
 
-from httpx import Client, AsyncClient
+from httpx import AsyncClient, Headers, Limits, Request, Response, Timeout, URL
 from loguru import logger
 
-import grpc
-from .models import hydrakv_pb2_grpc
-from .models import hydrakv_pb2
+import orjson
 
-from .models.http_models import *
+# grpc and the generated protobuf modules are only imported once a client is
+# created with use_grpc=True (see _import_grpc), so HTTP-only users never pay for them
+grpc = None
+hydrakv_pb2 = None
+hydrakv_pb2_grpc = None
 
-import json
+# request bodies are serialised with orjson and sent as raw content
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# requests sent via Hydrakv._send bypass the client's request building,
+# so they carry the client timeout as an extension themselves
+_TIMEOUT = Timeout(5.0, connect=2.0)
+_REQUEST_EXTENSIONS = {"timeout": _TIMEOUT.as_dict()}
+
+# channel arguments for many concurrent RPCs multiplexed on one channel;
+# grpc_options passed to the client override these
+_DEFAULT_GRPC_OPTIONS = {
+    "grpc.keepalive_time_ms": 30000,
+    "grpc.max_concurrent_streams": 1000,
+    "grpc.http2.max_pings_without_data": 0,
+    # the channel keeps its own subchannels rather than sharing grpc's global pool,
+    # and calls skip the retry machinery (and the per-call state it buffers)
+    "grpc.use_local_subchannel_pool": 1,
+    "grpc.enable_retries": 0,
+}
+
+
+def _import_grpc() -> None:
+    """
+    Imports grpc and the generated protobuf modules into the module namespace on first use.
+    """
+    global grpc, hydrakv_pb2, hydrakv_pb2_grpc
+    if grpc is None:
+        import grpc.aio
+        from .models import hydrakv_pb2, hydrakv_pb2_grpc
+
+
+def _json(resp: Response) -> Any:
+    """
+    Decodes a JSON response body with orjson instead of httpx's stdlib-based resp.json().
+
+    Parameters:
+    resp (Response): The HTTP response.
+
+    Returns:
+    Any: The decoded body.
+    """
+    return orjson.loads(resp.content)
+
+
+class DBHandle:
+    """
+    A lightweight handle bound to a single database of a Hydrakv client.
+
+    The database name and its API key are resolved once when the handle is
+    opened via Hydrakv.open(), so the key-value methods below skip the
+    per-call API key lookup. The methods return the client's coroutine
+    directly and are awaited like the client methods.
+    """
+
+    __slots__ = ("_client", "db", "_api_key")
+
+    def __init__(self, client: "Hydrakv", db: str, api_key: str) -> None:
+        self._client = client
+        self.db = db
+        self._api_key = api_key
+
+    def set(self, key: str, value: str, ttl: int = 0) -> Awaitable[int | Any]:
+        return self._client.set(self.db, key, value, ttl, self._api_key)
+
+    def get(self, key: str) -> Awaitable[str]:
+        return self._client.get(self.db, key, self._api_key)
+
+    def setnx(self, key: str, value: str, ttl: int = 0) -> Awaitable[int]:
+        return self._client.setnx(self.db, key, value, ttl, self._api_key)
+
+    def incr(self, key: str, delta: int = 1) -> Awaitable[int]:
+        return self._client.incr(self.db, key, delta, self._api_key)
+
+    def delete(self, key: str) -> Awaitable[Any]:
+        return self._client.delete(self.db, key, self._api_key)
+
+    def mset(self, items: List[Tuple[str, str, int]]) -> Awaitable[List[int | Any]]:
+        return self._client.mset(self.db, items, self._api_key)
+
+    def mget(self, keys: List[str]) -> Awaitable[List[str]]:
+        return self._client.mget(self.db, keys, self._api_key)
 
 
 class Hydrakv:
@@ -27,15 +110,15 @@ class Hydrakv:
 
     def __init__(self, host: str = "127.0.0.1", port: int = 9191, use_grpc: bool = False, grpc_port: int = 9292,
                  grpc_deadline: int = 3, https: bool = False, log_lvl: str = "DEBUG", trusted_cert: str = None,
-                 api_key: Dict = None) -> None:
+                 api_key: Dict = None, grpc_options: List[Tuple[str, Any]] = None) -> None:
         """
         Initializes the client for connecting to a HydraKV server.
 
         The constructor sets up the basic connection parameters such as host, port,
-        protocol type (HTTP or HTTPS), and whether gRPC is used. It also configures
-        the logging mechanism and validates the connection to ensure the server can
-        be reached. If the server is unreachable or improperly configured, an exception
-        will be raised.
+        protocol type (HTTP or HTTPS), and whether gRPC is used, and configures the
+        logging mechanism. It performs no network I/O: the gRPC channel and the HTTP
+        client are created on first use. Call connect() (or construct the client via
+        Hydrakv.create()) to validate the connection up front.
 
         Attributes:
             log_lvl: Specifies the logging level.
@@ -51,10 +134,7 @@ class Hydrakv:
             log_lvl: String denoting the logging level, e.g., "DEBUG", "INFO".
             trusted_cert: Path to the trusted certificate file for HTTPS connections.
             api_key: The API key for authentication. e.g {"dbname": "apikey", ...}
-
-        Raises:
-            Exception: Raised if the client cannot connect to the HydraKV server or if the
-                       server configuration is invalid.
+            grpc_options: Extra gRPC channel arguments, e.g. [("grpc.keepalive_time_ms", 30000)].
         """
 
         # set connection parameters
@@ -71,6 +151,10 @@ class Hydrakv:
         self._stub = None
         self._grpc_deadline = grpc_deadline
         self._apikeys = None
+        self._grpc_options = list(grpc_options) if grpc_options else []
+        self._connected = False
+        self._header_cache: Dict[str, Headers] = {}
+        self._url_cache: Dict[str, URL] = {}
 
         # configure logger
         self._configure_logger()
@@ -79,6 +163,7 @@ class Hydrakv:
         if self._use_grpc:
             logger.debug(f"Using gRPC on port {grpc_port}")
             self._grpc_port = grpc_port
+            _import_grpc()
 
         # set api keys
         if isinstance(api_key, dict):
@@ -89,26 +174,76 @@ class Hydrakv:
         # set the protocol
         self._set_protocol()
 
+    @classmethod
+    async def create(cls, *args: Any, **kwargs: Any) -> "Hydrakv":
+        """
+        Creates a client and checks the connection to the server.
+
+        Takes the same arguments as the constructor.
+
+        Returns:
+            Hydrakv: The connected client.
+        """
+        client = cls(*args, **kwargs)
+        await client.connect()
+        return client
+
+    async def connect(self) -> None:
+        """
+        Checks that the HydraKV server can be reached.
+
+        This is optional - every operation connects on first use - but validates the
+        server address up front. Subsequent calls return immediately once connected.
+
+        Raises:
+            ConnectionError: Raised if the server cannot be reached.
+            Exception: Raised if the server answers the health check with a server error (5xx).
+                       Any other answer is accepted; it is not verified to come from HydraKV.
+        """
+        if self._connected:
+            return
+
         # Ok lets Check if we can connect to the server
-        try:
-            resp = self._chk_connection()
-            if "exists" not in resp.keys():
-                raise Exception("Could not connect to HydraKV Server - please check IP / Port")
-            else:
-                print("Connected to HydraKV Server")
-        except SystemExit:
-            logger.warning("HydraKV Server is not reachable at start, but client is initialized.")
+        if not await self._chk_connection():
+            raise Exception("Could not connect to HydraKV Server - please check IP / Port")
+        await self.warmup()
+        self._connected = True
+        print("Connected to HydraKV Server")
+
+    async def warmup(self, n: int = 4) -> None:
+        """
+        Opens the connections to the server before the first real request.
+
+        Over HTTP, n concurrent HEAD requests on /health make the shared AsyncClient
+        resolve the host and complete the TCP/TLS handshakes up front. Over gRPC, the
+        channel is opened and awaited until it is ready. Called by connect().
+
+        Parameters:
+            n (int): The number of concurrent HTTP requests used to open the pool. Defaults to 4.
+
+        Raises:
+            ConnectionError: If the gRPC channel does not become ready within the gRPC deadline.
+        """
+        if self._use_grpc:
+            self.stub
+            try:
+                await wait_for(self._channel.channel_ready(), self._grpc_deadline)
+            except AsyncTimeoutError as e:
+                self._logger.error(f"gRPC server not reachable at {self._host}:{self._grpc_port}")
+                raise ConnectionError(f"gRPC channel to {self._host}:{self._grpc_port} "
+                                      f"not ready within {self._grpc_deadline}s") from e
+        else:
+            client = self._get_client()
+            await gather(*(client.head("/health") for _ in range(n)))
 
     def _set_protocol(self) -> None:
         """
-        Sets the communication protocol (HTTP/HTTPS) and initializes the appropriate
-        channel or string identifier for transport, depending on the provided settings.
+        Sets the communication protocol (HTTP/HTTPS) and the URL prefix for HTTP
+        communications, depending on the provided settings.
 
-        This method configures either a secure or insecure channel for gRPC, or a URL
-        prefix for HTTP communications. The choice of protocol depends on
-        whether HTTPS or HTTP is enabled in the configuration. A warning is logged to
-        indicate the use of either option, especially highlighting the insecurity of
-        using HTTP for production use.
+        No channel or connection is opened here; the gRPC channel is created lazily
+        by the stub property. A warning is logged to indicate the use of either
+        option, especially highlighting the insecurity of using HTTP for production use.
 
         :raises Warning: Logs a warning for security-related context with protocol selection.
         """
@@ -116,22 +251,118 @@ class Hydrakv:
         # set protocol
         if self._https:
             self._logger.warning("Using HTTPS")
-            if self._use_grpc:
-                self._channel = grpc.secure_channel(f"{self._host}:{self._grpc_port}",
-                                                    grpc.ssl_channel_credentials(self._get_trusted_cert()))
-                self._stub = hydrakv_pb2_grpc.KVServiceStub(self._channel)
 
             # set the http string
             self._http_str = "https://"
         else:
             self._logger.warning("Using HTTP - not recommended for production use! HTTP is insecure.")
-            if self._use_grpc:
-                self._channel = grpc.insecure_channel(f"{self._host}:{self._grpc_port}")
-                self._stub = hydrakv_pb2_grpc.KVServiceStub(self._channel)
 
             # set the http string
             self._http_str = "http://"
 
+        # build the URL prefixes once instead of formatting them on every request;
+        # the shared AsyncClient resolves relative paths against _base
+        self._base = f"{self._http_str}{self._host}:{self._port}"
+        self._db_url_cache: Dict[str, str] = {}
+
+    def _db_url(self, db: str) -> str:
+        """
+        Returns the cached path of a database endpoint, relative to the server URL.
+
+        Parameters:
+        db (str): The name of the database.
+
+        Returns:
+        str: The path, e.g. "/db/<db>".
+        """
+        url = self._db_url_cache.get(db)
+        if url is None:
+            url = self._db_url_cache[db] = f"/db/{db}"
+        return url
+
+    def _hdrs(self, api_key: str) -> Headers:
+        """
+        Returns the cached request headers for an API key.
+
+        The headers are built once per key instead of allocating and normalising
+        a new dict on every request. They include the client's default headers,
+        as requests sent via _send() are not merged with them.
+
+        Parameters:
+        api_key (str): The API key for authentication, may be empty.
+
+        Returns:
+        Headers: The JSON content type plus the X-API-Key header if api_key is set.
+        """
+        headers = self._header_cache.get(api_key)
+        if headers is None:
+            headers = Headers(self._get_client().headers)
+            headers.update({"X-API-Key": api_key, **_JSON_HEADERS} if api_key else _JSON_HEADERS)
+            self._header_cache[api_key] = headers
+        return headers
+
+    def _send(self, method: str, path: str, body: bytes = None, api_key: str = "") -> Awaitable[Response]:
+        """
+        Sends a request through the shared AsyncClient.
+
+        All HTTP calls of the client go through here. The request is constructed
+        directly from the cached absolute URL and headers and handed to client.send(),
+        skipping the URL resolution and header merging client.request() repeats on
+        every call.
+
+        Parameters:
+        method (str): The HTTP method.
+        path (str): The path of the endpoint, relative to the server URL.
+        body (bytes, optional): The JSON encoded request body.
+        api_key (str, optional): The API key for authentication, may be empty.
+
+        Returns:
+        Awaitable[Response]: The pending response.
+        """
+        url = self._url_cache.get(path)
+        if url is None:
+            url = self._url_cache[path] = URL(self._base + path)
+        request = Request(method, url, content=body, headers=self._hdrs(api_key), extensions=_REQUEST_EXTENSIONS)
+        return self._get_client().send(request)
+
+    @property
+    def stub(self) -> "hydrakv_pb2_grpc.KVServiceStub":
+        """
+        Returns the gRPC stub, opening the secure or insecure channel on first access.
+
+        The channel is a grpc.aio channel, so RPCs are awaited on the event loop and
+        concurrent calls are multiplexed instead of blocking the loop one at a time.
+        Being bound to the running event loop, it must first be accessed from a coroutine.
+
+        Returns:
+            KVServiceStub: The stub bound to the client's gRPC channel.
+        """
+        if self._stub is None:
+            target = f"{self._host}:{self._grpc_port}"
+            options = list({**_DEFAULT_GRPC_OPTIONS, **dict(self._grpc_options)}.items())
+            if self._https:
+                self._channel = grpc.aio.secure_channel(target,
+                                                        grpc.ssl_channel_credentials(self._get_trusted_cert()),
+                                                        options=options)
+            else:
+                self._channel = grpc.aio.insecure_channel(target, options=options)
+            self._stub = hydrakv_pb2_grpc.KVServiceStub(self._channel)
+        return self._stub
+
+    async def close(self) -> None:
+        """
+        Closes the gRPC channel and the HTTP client, if they were opened.
+
+        The client can still be used afterwards; both are reopened on demand.
+        """
+        if self._channel is not None:
+            await self._channel.close()
+            self._channel = None
+            self._stub = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     def _get_trusted_cert(self) -> str:
         """
         Retrieves the trusted certificate from the provided file path.
@@ -154,6 +385,10 @@ class Hydrakv:
         Raises:
             None
         """
+        # remember whether debug messages are emitted at all, so the request path
+        # can skip formatting them (and loguru's per-call overhead) otherwise
+        self._debug_on = self.log_lvl.upper() in ("TRACE", "DEBUG")
+
         # configure logger
         logger.remove()
         logger.add(
@@ -170,35 +405,48 @@ class Hydrakv:
         Returns an instance of AsyncClient.
 
         This method checks if the internal AsyncClient instance is already created.
-        If it is not, a new instance is created and returned.
+        If it is not, a new instance is created and returned. The client is bound
+        to the server URL, negotiates HTTP/2 where the server offers it and keeps
+        a large pool of keep-alive connections, so concurrent requests reuse
+        connections instead of paying a new handshake.
 
         Returns:
             AsyncClient: An instance of AsyncClient.
         """
         if self._client is None:
             self._logger.debug("Creating new AsyncClient")
-            self._client = AsyncClient()
+            verify = ssl.create_default_context(cafile=self._trusted_cert) if self._trusted_cert else True
+            self._client = AsyncClient(
+                http2=True,
+                base_url=self._base,
+                limits=Limits(max_connections=256, max_keepalive_connections=256, keepalive_expiry=60.0),
+                timeout=_TIMEOUT,
+                verify=verify,
+            )
         return self._client
 
-    def _chk_connection(self) -> Dict:
+    async def _chk_connection(self) -> bool:
         """
-        Checks the connection to the server by sending a GET request to a random,
-        non-existent database endpoint. This is used to confirm if the server responds
-        as expected.
+        Checks the connection to the server by sending a HEAD request to its health
+        endpoint. No body is transferred or parsed, and the request goes through the
+        shared AsyncClient, so the connection it opens is reused by later requests.
 
         Returns:
-            Dict: The JSON response from the server indicating the connection status.
+            bool: True if the server answered without a server error.
+
+        Raises:
+            ConnectionError: If the request fails, e.g. the server is not reachable.
         """
-        # Check if we have a connection - we will GET a random DB - lets see if the Server responses
+        # Check if we have a connection - a HEAD on /health is the cheapest request the server answers
         try:
-            with Client() as client:
-                self._logger.debug("Checking Connection")
-                response = client.get(f"{self._http_str}{self._host}:{self._port}/db/random4223423")
-                self._logger.debug(response.json())
-            return response.json()
+            client = self._get_client()
+            self._logger.debug("Checking Connection")
+            response = await client.head("/health")
+            self._logger.debug(f"health check returned {response.status_code}")
+            return response.status_code < 500
         except Exception as e:
             self._logger.error("Not connected to Server: " + str(e))
-            exit(1)
+            raise ConnectionError(str(e)) from e
 
     async def set(self, db: str, key: str, value: str, ttl: int = 0, api_key: str = None) -> int | Any:
         """
@@ -224,26 +472,24 @@ class Hydrakv:
         if api_key is None:
             api_key = self._apikeys.get(db, "")
 
-        # create the model for the request
-        sr = Set(key=key, apikey=api_key, value=value, ttl=ttl)
-
         if self._use_grpc:
             try:
-                self._logger.debug("using GRPC SET")
-                request = hydrakv_pb2.SetRequest(db=db, apikey=sr.apikey, key=sr.key, value=sr.value, ttl=sr.ttl)
-                response = self._stub.Set(request, timeout=self._grpc_deadline)
+                if self._debug_on:
+                    self._logger.debug("using GRPC SET")
+                request = hydrakv_pb2.SetRequest(db=db, apikey=api_key, key=key, value=value, ttl=ttl)
+                response = await self.stub.Set(request, timeout=self._grpc_deadline)
                 return response
             except grpc.RpcError as e:
                 self._logger.error(f"GRPC SET failed: {e}")
                 raise
         else:
             try:
-                self._logger.debug("using HTTP SET")
-                client = self._get_client()
-                headers = {"X-API-Key": api_key} if api_key else {}
-                self._logger.debug(f"sending PUT to {self._http_str}{self._host}:{self._port}/db/{db}")
-                resp = await client.put(f"{self._http_str}{self._host}:{self._port}/db/{db}", json=sr.model_dump(),
-                                        headers=headers)
+                url = self._db_url(db)
+                if self._debug_on:
+                    self._logger.debug("using HTTP SET")
+                    self._logger.debug(f"sending PUT to {url}")
+                body = orjson.dumps({"ttl": ttl, "key": key, "value": value, "apikey": api_key})
+                resp = await self._send("PUT", url, body, api_key)
                 return resp.status_code
             except Exception as e:
                 self._logger.error(f"HTTP SET failed: {e}")
@@ -272,27 +518,25 @@ class Hydrakv:
         if api_key is None:
             api_key = self._apikeys.get(db, "")
 
-        # create the model for the request
-        gr = Get(key=key, apikey=api_key)
-
         if self._use_grpc:
             try:
-                self._logger.debug("using GRPC GET")
-                request = hydrakv_pb2.GetRequest(db=db, apikey=gr.apikey, key=key)
-                response = self._stub.Get(request, timeout=self._grpc_deadline)
+                if self._debug_on:
+                    self._logger.debug("using GRPC GET")
+                request = hydrakv_pb2.GetRequest(db=db, apikey=api_key, key=key)
+                response = await self.stub.Get(request, timeout=self._grpc_deadline)
                 return response.value
             except grpc.RpcError as e:
                 self._logger.error(f"GRPC GET failed: {e}")
                 raise
         else:
             try:
-                self._logger.debug("using HTTP GET")
-                client = self._get_client()
-                headers = {"X-API-Key": api_key} if api_key else {}
-                self._logger.debug(f"sending POST to {self._http_str}{self._host}:{self._port}/db/{db}/keys")
-                resp = await client.post(f"{self._http_str}{self._host}:{self._port}/db/{db}/keys", json=gr.model_dump(),
-                                         headers=headers)
-                return resp.json()["value"]
+                url = self._db_url(db) + "/keys"
+                if self._debug_on:
+                    self._logger.debug("using HTTP GET")
+                    self._logger.debug(f"sending POST to {url}")
+                body = orjson.dumps({"key": key, "apikey": api_key})
+                resp = await self._send("POST", url, body, api_key)
+                return _json(resp)["value"]
             except Exception as e:
                 self._logger.error(f"HTTP GET failed: {e}")
                 raise
@@ -315,25 +559,24 @@ class Hydrakv:
         if api_key is None:
             api_key = self._apikeys.get(db, "")
 
-        sr = SetNX(key=key, value=value, ttl=ttl, apikey=api_key)
-
         if self._use_grpc:
             try:
-                self._logger.debug("using GRPC SETNX")
-                request = hydrakv_pb2.SetRequest(db=db, apikey=sr.apikey, key=sr.key, value=sr.value, ttl=sr.ttl)
-                response = self._stub.SetNX(request, timeout=self._grpc_deadline)
+                if self._debug_on:
+                    self._logger.debug("using GRPC SETNX")
+                request = hydrakv_pb2.SetRequest(db=db, apikey=api_key, key=key, value=value, ttl=ttl)
+                response = await self.stub.SetNX(request, timeout=self._grpc_deadline)
                 return response.ok
             except grpc.RpcError as e:
                 self._logger.error(f"GRPC SETNX failed: {e}")
                 raise
         else:
             try:
-                self._logger.debug("using HTTP SETNX")
-                client = self._get_client()
-                headers = {"X-API-Key": api_key} if api_key else {}
-                self._logger.debug(f"sending POST to {self._http_str}{self._host}:{self._port}/db/{db}")
-                resp = await client.post(f"{self._http_str}{self._host}:{self._port}/db/{db}", json=sr.model_dump(),
-                                         headers=headers)
+                url = self._db_url(db)
+                if self._debug_on:
+                    self._logger.debug("using HTTP SETNX")
+                    self._logger.debug(f"sending POST to {url}")
+                body = orjson.dumps({"ttl": ttl, "key": key, "value": value, "apikey": api_key})
+                resp = await self._send("POST", url, body, api_key)
                 return resp.status_code
             except Exception as e:
                 self._logger.error(f"HTTP SETNX failed: {e}")
@@ -357,24 +600,22 @@ class Hydrakv:
         if api_key is None:
             api_key = self._apikeys.get(db, "")
 
-        ir = Incr(key=key, apikey=api_key, delta=delta)
-
         if self._use_grpc:
             try:
-                self._logger.debug("using GRPC INCR")
-                request = hydrakv_pb2.IncrRequest(db=db, apikey=ir.apikey, key=ir.key, amount=str(ir.delta))
-                response = self._stub.Incr(request, timeout=self._grpc_deadline)
+                if self._debug_on:
+                    self._logger.debug("using GRPC INCR")
+                request = hydrakv_pb2.IncrRequest(db=db, apikey=api_key, key=key, amount=str(delta))
+                response = await self.stub.Incr(request, timeout=self._grpc_deadline)
                 return response.ok
             except grpc.RpcError as e:
                 self._logger.error(f"GRPC INCR failed: {e}")
                 raise
         else:
             try:
-                self._logger.debug("using HTTP INCR")
-                client = self._get_client()
-                headers = {"X-API-Key": api_key} if api_key else {}
-                resp = await client.request("PATCH", f"{self._http_str}{self._host}:{self._port}/db/{db}",
-                                            json=ir.model_dump(), headers=headers)
+                if self._debug_on:
+                    self._logger.debug("using HTTP INCR")
+                body = orjson.dumps({"key": key, "delta": delta, "apikey": api_key})
+                resp = await self._send("PATCH", self._db_url(db), body, api_key)
                 return resp.status_code
             except Exception as e:
                 self._logger.error(f"HTTP INCR failed: {e}")
@@ -396,30 +637,68 @@ class Hydrakv:
         if api_key is None:
             api_key = self._apikeys.get(db, "")
 
-        dr = Delete(key=key, apikey=api_key)
-
         if self._use_grpc:
             try:
-                self._logger.debug("using GRPC DELETE")
-                request = hydrakv_pb2.DeleteRequest(db=db, apikey=dr.apikey, key=dr.key)
-                response = self._stub.Delete(request, timeout=self._grpc_deadline)
+                if self._debug_on:
+                    self._logger.debug("using GRPC DELETE")
+                request = hydrakv_pb2.DeleteRequest(db=db, apikey=api_key, key=key)
+                response = await self.stub.Delete(request, timeout=self._grpc_deadline)
                 return response
             except grpc.RpcError as e:
                 self._logger.error(f"GRPC DELETE failed: {e}")
                 raise
         else:
             try:
-                self._logger.debug("using HTTP DELETE")
-                client = self._get_client()
-                headers = {"X-API-Key": api_key} if api_key else {}
-                self._logger.debug(f"sending DELETE to {self._http_str}{self._host}:{self._port}/db/{db}/{key}")
-                resp = await client.request("DELETE", f"{self._http_str}{self._host}:{self._port}/db/{db}/keys",
-                                            json=dr.model_dump(), headers=headers)
+                url = self._db_url(db) + "/keys"
+                if self._debug_on:
+                    self._logger.debug("using HTTP DELETE")
+                    self._logger.debug(f"sending DELETE to {url}")
+                # the server's delete route takes the key in the body, like get
+                body = orjson.dumps({"key": key, "apikey": api_key})
+                resp = await self._send("DELETE", url, body, api_key)
                 return resp.status_code
             except Exception as e:
                 self._logger.error(f"HTTP DELETE failed: {e}")
                 raise
 
+    async def mset(self, db: str, items: List[Tuple[str, str, int]], api_key: str = None) -> List[int | Any]:
+        """
+        Asynchronously sets multiple key-value pairs in the database.
+
+        The server has no bulk endpoint, so the individual set calls are issued
+        concurrently and pipelined over the shared HTTP/2 connection (or gRPC
+        channel) rather than awaited one after another.
+
+        Parameters:
+            db (str): The name of the database where the key-value pairs should be set.
+            items (List[Tuple[str, str, int]]): The (key, value, ttl) triples to set.
+            api_key (str, optional): The API key for authentication. If not provided, it will be looked up in the instance's API keys.
+
+        Returns:
+            List[int | Any]: The result of each set call, in the order of items.
+        """
+        if api_key is None:
+            api_key = self._apikeys.get(db, "")
+        return await gather(*(self.set(db, key, value, ttl, api_key) for key, value, ttl in items))
+
+    async def mget(self, db: str, keys: List[str], api_key: str = None) -> List[str]:
+        """
+        Asynchronously retrieves the values of multiple keys from the database.
+
+        Like mset, the get calls are issued concurrently over the shared connection.
+
+        Parameters:
+            db (str): The name of the database from which to retrieve the values.
+            keys (List[str]): The keys whose values are being requested.
+            api_key (str, optional): The API key for authentication. If not provided, it will be looked up in the instance's API keys.
+
+        Returns:
+            List[str]: The values associated with the keys, in the order of keys.
+        """
+        if api_key is None:
+            api_key = self._apikeys.get(db, "")
+        return await gather(*(self.get(db, key, api_key) for key in keys))
+
     async def delete_db(self, name: str = "", api_key: str = None) -> int:
         """
         Deletes a database with the specified name.
@@ -439,15 +718,31 @@ class Hydrakv:
             api_key = self._apikeys.get(name, "")
 
         try:
-            client = self._get_client()
-            headers = {"X-API-Key": api_key} if api_key else {}
-            resp = await client.delete(f"{self._http_str}{self._host}:{self._port}/db/{name}", headers=headers)
+            resp = await self._send("DELETE", self._db_url(name), api_key=api_key)
             self._logger.debug("Deleted DB: " + name)
             return resp.status_code
         except Exception as e:
             self._logger.error(f"Failed to delete DB: {name}, error: {e}")
             raise
 
+    def open(self, db: str, api_key: str = None) -> DBHandle:
+        """
+        Returns a handle bound to the given database.
+
+        The API key is resolved once here, so a key renewed later via
+        renew_api_key_for_db() requires opening a new handle.
+
+        Parameters:
+        db (str): The name of the database.
+        api_key (str, optional): The API key for authentication. If not provided, it will be looked up in the instance's API keys.
+
+        Returns:
+        DBHandle: A handle exposing set/get/setnx/incr/delete for the database.
+        """
+        if api_key is None:
+            api_key = self._apikeys.get(db, "")
+        return DBHandle(self, db, api_key)
+
     def get_api_key_for_db(self, db: str) -> str:
         """
         Retrieves the API key associated with a specific database.
@@ -467,8 +762,8 @@ class Hydrakv:
         Returns:
         None: This function does not return a value, it saves the keys to a file.
         """
-        with open('api_keys.json', 'w') as f:
-            json.dump(self._apikeys, f)
+        with open('api_keys.json', 'wb') as f:
+            f.write(orjson.dumps(self._apikeys, option=orjson.OPT_INDENT_2))
 
     async def renew_api_key_for_db(self, db: str) -> str:
         """
@@ -482,16 +777,14 @@ class Hydrakv:
         """
 
         try:
-            client = self._get_client()
-            resp = await client.request("UPDATE", f"{self._http_str}{self._host}:{self._port}/db/{db}",
-                                        headers={"X-API-Key": self._apikeys.get(db, "")})
+            resp = await self._send("UPDATE", self._db_url(db), api_key=self._apikeys.get(db, ""))
 
             if resp.status_code == 503:
                 raise Exception(f"Server currently not using API_KEY auth for DB: {db}")
                 return ""
 
-            self._apikeys[db] = resp.json()["apikey"]
-            return resp.json()["apikey"]
+            self._apikeys[db] = _json(resp)["apikey"]
+            return self._apikeys[db]
         except Exception as e:
             self._logger.error(f"Error renewing API key for DB: {db} - {e}")
             return ""
@@ -515,19 +808,87 @@ class Hydrakv:
             request.
         """
         try:
-            cd = CreateDB(name=name)
-            client = self._get_client()
-            resp = await client.post(f"{self._http_str}{self._host}:{self._port}/create", json=cd.model_dump())
+            resp = await self._send("POST", "/create", orjson.dumps({"name": name}))
         except Exception as e:
             self._logger.error(f"Failed to create DB: {name}, error: {e}")
 
         # save new api key if present
-        if "apikey" in resp.json().keys():
-            self._apikeys[name] = resp.json()["apikey"]
+        data = _json(resp)
+        if "apikey" in data:
+            self._apikeys[name] = data["apikey"]
 
         self._logger.debug("Created DB: " + name)
         return resp.status_code
 
+    async def exists_db(self, name: str) -> bool:
+        """
+        Checks whether a database with the specified name exists.
+
+        Parameters:
+        name (str): The name of the database.
+
+        Returns:
+        bool: True if the database exists, otherwise False.
+        """
+        if self._use_grpc:
+            try:
+                self._logger.debug("using GRPC EXISTS")
+                request = hydrakv_pb2.ExistsRequest(db=name)
+                response = await self.stub.Exists(request, timeout=self._grpc_deadline)
+                return response.exists
+            except grpc.RpcError as e:
+                self._logger.error(f"GRPC EXISTS failed: {e}")
+                raise
+        else:
+            try:
+                self._logger.debug("using HTTP EXISTS")
+                resp = await self._send("GET", self._db_url(name))
+                return bool(_json(resp).get("exists", False))
+            except Exception as e:
+                self._logger.error(f"HTTP EXISTS failed: {e}")
+                raise
+
+    async def ensure_db(self, name: str) -> bool:
+        """
+        Creates a database unless it already exists.
+
+        Parameters:
+        name (str): The name of the database.
+
+        Returns:
+        bool: True if the database was created, False if it already existed.
+
+        Raises:
+        Exception: If the server rejects the creation.
+        """
+        if await self.exists_db(name):
+            return False
+        status = await self.create_db(name)
+        if status >= 400:
+            raise Exception(f"Failed to create DB: {name}, status code: {status}")
+        return True
+
+    async def drop_db_if_exists(self, name: str, api_key: str = None) -> bool:
+        """
+        Deletes a database if it exists.
+
+        Parameters:
+        name (str): The name of the database.
+        api_key (str, optional): The API key for authentication. If not provided, it will be looked up in the instance's API keys.
+
+        Returns:
+        bool: True if the database was deleted, False if it did not exist.
+
+        Raises:
+        Exception: If the server rejects the deletion.
+        """
+        if not await self.exists_db(name):
+            return False
+        status = await self.delete_db(name, api_key)
+        if status >= 400:
+            raise Exception(f"Failed to delete DB: {name}, status code: {status}")
+        return True
+
     async def fifolifo_delete(self, name: str) -> int | Any:
         """
         Deletes a FiFoLiFo by name.
@@ -538,13 +899,11 @@ class Hydrakv:
         Returns:
         int | Any: The status code or gRPC response.
         """
-        ffr = FiFoLiFoDelete(name=name)
-
         if self._use_grpc:
             try:
                 self._logger.debug("using GRPC FIFOLIFO DELETE")
-                request = hydrakv_pb2.FiFoLiFoDeleteRequest(name=ffr.name)
-                response = self._stub.FiFoLiFoDelete(request, timeout=self._grpc_deadline)
+                request = hydrakv_pb2.FiFoLiFoDeleteRequest(name=name)
+                response = await self.stub.FiFoLiFoDelete(request, timeout=self._grpc_deadline)
                 return response
             except grpc.RpcError as e:
                 self._logger.error(f"GRPC FIFOLIFO DELETE failed: {e}")
@@ -552,9 +911,7 @@ class Hydrakv:
         else:
             try:
                 self._logger.debug("using HTTP FIFOLIFO DELETE")
-                client = self._get_client()
-                resp = await client.request("DELETE", f"{self._http_str}{self._host}:{self._port}/fifolifo",
-                                            json=ffr.model_dump())
+                resp = await self._send("DELETE", "/fifolifo", orjson.dumps({"name": name}))
                 return resp.status_code
             except Exception as e:
                 self._logger.error(f"HTTP FIFOLIFO DELETE failed: {e}")
@@ -571,13 +928,11 @@ class Hydrakv:
         Returns:
         int | Any: The status code or gRPC response.
         """
-        ffp = FiFoLiFoPush(name=name, value=value)
-
         if self._use_grpc:
             try:
                 self._logger.debug("using GRPC FIFOLIFO PUSH")
-                request = hydrakv_pb2.FiFoLiFoPushRequest(name=ffp.name, value=ffp.value)
-                response = self._stub.FiFoLiFoPush(request, timeout=self._grpc_deadline)
+                request = hydrakv_pb2.FiFoLiFoPushRequest(name=name, value=value)
+                response = await self.stub.FiFoLiFoPush(request, timeout=self._grpc_deadline)
                 return response
             except grpc.RpcError as e:
                 self._logger.error(f"GRPC FIFOLIFO PUSH failed: {e}")
@@ -585,9 +940,7 @@ class Hydrakv:
         else:
             try:
                 self._logger.debug("using HTTP FIFOLIFO PUSH")
-                client = self._get_client()
-                resp = await client.put(f"{self._http_str}{self._host}:{self._port}/fifolifo",
-                                        json=ffp.model_dump())
+                resp = await self._send("PUT", "/fifolifo", orjson.dumps({"name": name, "value": value}))
                 return resp.status_code
             except Exception as e:
                 self._logger.error(f"HTTP FIFOLIFO PUSH failed: {e}")
@@ -603,13 +956,11 @@ class Hydrakv:
         Returns:
         str: The popped value.
         """
-        ffp = FiFoLiFoPop(name=name)
-
         if self._use_grpc:
             try:
                 self._logger.debug("using GRPC FIFO POP")
-                request = hydrakv_pb2.FiFoLiFoPopRequest(name=ffp.name)
-                response = self._stub.FiFoLiFoFPop(request, timeout=self._grpc_deadline)
+                request = hydrakv_pb2.FiFoLiFoPopRequest(name=name)
+                response = await self.stub.FiFoLiFoFPop(request, timeout=self._grpc_deadline)
                 return response.value
             except grpc.RpcError as e:
                 self._logger.error(f"GRPC FIFO POP failed: {e}")
@@ -617,10 +968,8 @@ class Hydrakv:
         else:
             try:
                 self._logger.debug("using HTTP FIFO POP")
-                client = self._get_client()
-                resp = await client.post(f"{self._http_str}{self._host}:{self._port}/fifo",
-                                         json=ffp.model_dump())
-                return resp.json().get("value", "")
+                resp = await self._send("POST", "/fifo", orjson.dumps({"name": name}))
+                return _json(resp).get("value", "")
             except Exception as e:
                 self._logger.error(f"HTTP FIFO POP failed: {e}")
                 raise
@@ -635,13 +984,11 @@ class Hydrakv:
         Returns:
         str: The popped value.
         """
-        ffp = FiFoLiFoPop(name=name)
-
         if self._use_grpc:
             try:
                 self._logger.debug("using GRPC LIFO POP")
-                request = hydrakv_pb2.FiFoLiFoPopRequest(name=ffp.name)
-                response = self._stub.FiFoLiFoLPop(request, timeout=self._grpc_deadline)
+                request = hydrakv_pb2.FiFoLiFoPopRequest(name=name)
+                response = await self.stub.FiFoLiFoLPop(request, timeout=self._grpc_deadline)
                 return response.value
             except grpc.RpcError as e:
                 self._logger.error(f"GRPC LIFO POP failed: {e}")
@@ -649,10 +996,8 @@ class Hydrakv:
         else:
             try:
                 self._logger.debug("using HTTP LIFO POP")
-                client = self._get_client()
-                resp = await client.post(f"{self._http_str}{self._host}:{self._port}/lifo",
-                                         json=ffp.model_dump())
-                return resp.json().get("value", "")
+                resp = await self._send("POST", "/lifo", orjson.dumps({"name": name}))
+                return _json(resp).get("value", "")
             except Exception as e:
                 self._logger.error(f"HTTP LIFO POP failed: {e}")
                 raise
@@ -669,13 +1014,9 @@ class Hydrakv:
         Returns:
         int: The status code of the response.
         """
-        ffc = FiFoLiFoCreate(name=name, limit=limit)
-
         try:
             self._logger.debug("using HTTP FIFOLIFO CREATE")
-            client = self._get_client()
-            resp = await client.post(f"{self._http_str}{self._host}:{self._port}/fifolifo",
-                                     json=ffc.model_dump())
+            resp = await self._send("POST", "/fifolifo", orjson.dumps({"name": name, "limit": limit}))
             return resp.status_code
         except Exception as e:
             self._logger.error(f"HTTP FIFOLIFO CREATE failed: {e}")
@@ -1,53 +1,114 @@
-from pydantic import BaseModel, Field
+from typing import Annotated, Any, Dict, List, Type, TypeVar
+
+from msgspec import Meta, Struct, convert
+from msgspec.json import Decoder
+
+# Length-capped field types, shared by all models that carry a key or an API key,
+# so oversized strings are rejected while decoding instead of being allocated
+Key = Annotated[str, Meta(max_length=512)]
+ApiKey = Annotated[str, Meta(max_length=128)] | None
+
+# Integer fields bounded to the server's int64, so out-of-range numbers are rejected
+# while decoding instead of being materialised as Python big ints
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+Ttl = Annotated[int, Meta(ge=0, le=_INT64_MAX)] | None
+Delta = Annotated[int, Meta(ge=_INT64_MIN, le=_INT64_MAX)]
+Limit = Annotated[int, Meta(ge=1, le=_INT64_MAX)]
+
+_T = TypeVar("_T", bound="_Base")
+
+# The request bodies are plain msgspec Structs: msgspec decodes JSON straight into
+# them in C, without pydantic's per-field validator chain. Field descriptions are not
+# kept on the classes; they live in schema.py, which only schema generation imports.
+class _Base(Struct, frozen=True, gc=False):
+    """
+    Shared config of all request models: leaf containers (gc=False) that are
+    immutable once decoded (frozen=True). Unknown fields are ignored on decode.
+    """
+
+    @classmethod
+    def from_dict(cls: Type[_T], data: Dict[str, Any]) -> _T:
+        """
+        Builds the model from an already parsed JSON object.
+
+        Parameters:
+        data (Dict[str, Any]): The parsed request body.
+
+        Returns:
+        _T: The validated instance of the model it is called on.
+        """
+        return convert(data, cls)
+
+# Base of the requests authenticated by a database API key; apikey is keyword-only,
+# so the subclasses can declare their required fields before it
+class _AuthedRequest(_Base, kw_only=True):
+    apikey: ApiKey = None
 
 # Create a DB
-class CreateDB(BaseModel):
-    name: str = Field(..., description="The name of the database to create.")
+class CreateDB(_Base):
+    name: str
 
 # Set or update a DB
-class UpdateDB(BaseModel):
-    apikey: str = Field(None, description="The API key for authentication.")
-    keys: str = Field(..., description="The keys to set or update.")
-    value: str = Field(..., description="The values to set or update.")
-
-# Set a value if not exists
-class SetNX(BaseModel):
-    ttl: int = Field(None, description="The time-to-live for the key in seconds.")
-    key: str = Field(..., description="The key to set.")
-    value: str = Field(..., description="The value to set.")
-    apikey: str = Field(None, description="The API key for authentication.")
-
-class Set(BaseModel):
-    ttl: int = Field(None, description="The time-to-live for the key in seconds.")
-    key: str = Field(..., description="The key to set.")
-    value: str = Field(..., description="The value to set.")
-    apikey: str = Field(None, description="The API key for authentication.")
+class UpdateDB(_AuthedRequest):
+    keys: str
+    value: str
+
+class Set(_AuthedRequest):
+    key: Key
+    value: str
+    ttl: Ttl = None
+
+# Set a value if not exists - same fields as Set, kept as its own type
+class SetNX(Set):
+    pass
+
+# One entry of a SetBatch, encoded as a [key, value, ttl] array instead of an object
+class SetItem(_Base, array_like=True):
+    key: Key
+    value: str
+    ttl: Ttl = None
+
+# Set many values with one request, validated in a single decode
+class SetBatch(_AuthedRequest):
+    items: List[SetItem]
 
 # Get a value
-class Get(BaseModel):
-    key: str = Field(..., description="The key to get.")
-    apikey: str = Field(None, description="The API key for authentication.")
+class Get(_AuthedRequest):
+    key: Key
 
 # Delete a key
-class Delete(BaseModel):
-    key: str = Field(..., description="The key to delete.")
-    apikey: str = Field(None, description="The API key for authentication.")
+class Delete(_AuthedRequest):
+    key: Key
+
+class Incr(_AuthedRequest):
+    key: Key
+    delta: Delta = 1
 
-class Incr(BaseModel):
-    key: str = Field(..., description="The key to increment.")
-    delta: int = Field(1, description="The amount by which to increment the key's value.")
-    apikey: str = Field(None, description="The API key for authentication.")
+class FiFoLiFoDelete(_Base):
+    name: str
 
-class FiFoLiFoDelete(BaseModel):
-    name: str = Field(..., description="The name of the FiFoLiFo to delete.")
+class FiFoLiFoPush(_Base):
+    name: str
+    value: str
 
-class FiFoLiFoPush(BaseModel):
-    name: str = Field(..., description="The name of the FiFoLiFo to push to.")
-    value: str = Field(..., description="The value to push.")
+class FiFoLiFoPop(_Base):
+    name: str
 
-class FiFoLiFoPop(BaseModel):
-    name: str = Field(..., description="The name of the FiFoLiFo to pop from.")
+class FiFoLiFoCreate(_Base):
+    name: str
+    limit: Limit
 
-class FiFoLiFoCreate(BaseModel):
-    name: str = Field(..., description="The name of the FiFoLiFo to create.")
-    limit: int = Field(..., description="The limit of the FiFoLiFo.")
+# Decoders built once per model; decoding a request body is then a single C call,
+# e.g. SET_DECODER.decode(body) -> Set
+CREATE_DB_DECODER = Decoder(CreateDB)
+UPDATE_DB_DECODER = Decoder(UpdateDB)
+SET_DECODER = Decoder(Set)
+SETNX_DECODER = Decoder(SetNX)
+SET_BATCH_DECODER = Decoder(SetBatch)
+GET_DECODER = Decoder(Get)
+DELETE_DECODER = Decoder(Delete)
+INCR_DECODER = Decoder(Incr)
+FIFOLIFO_DELETE_DECODER = Decoder(FiFoLiFoDelete)
+FIFOLIFO_PUSH_DECODER = Decoder(FiFoLiFoPush)
+FIFOLIFO_POP_DECODER = Decoder(FiFoLiFoPop)
+FIFOLIFO_CREATE_DECODER = Decoder(FiFoLiFoCreate)
@@ -0,0 +1,78 @@
+from typing import Any, Dict, Iterable
+
+from msgspec.json import schema_components
+
+from . import http_models
+
+# Field descriptions of the request models, keyed "<Model>.<field>". Inherited fields
+# are described once on the class that declares them.
+DESCRIPTIONS: Dict[str, str] = {
+    "_AuthedRequest.apikey": "The API key for authentication.",
+    "CreateDB.name": "The name of the database to create.",
+    "UpdateDB.keys": "The keys to set or update.",
+    "UpdateDB.value": "The values to set or update.",
+    "Set.key": "The key to set.",
+    "Set.value": "The value to set.",
+    "Set.ttl": "The time-to-live for the key in seconds.",
+    "SetBatch.items": "The [key, value, ttl] entries to set.",
+    "Get.key": "The key to get.",
+    "Delete.key": "The key to delete.",
+    "Incr.key": "The key to increment.",
+    "Incr.delta": "The amount by which to increment the key's value.",
+    "FiFoLiFoDelete.name": "The name of the FiFoLiFo to delete.",
+    "FiFoLiFoPush.name": "The name of the FiFoLiFo to push to.",
+    "FiFoLiFoPush.value": "The value to push.",
+    "FiFoLiFoPop.name": "The name of the FiFoLiFo to pop from.",
+    "FiFoLiFoCreate.name": "The name of the FiFoLiFo to create.",
+    "FiFoLiFoCreate.limit": "The limit of the FiFoLiFo.",
+}
+
+MODELS = (
+    http_models.CreateDB, http_models.UpdateDB, http_models.Set, http_models.SetNX, http_models.SetBatch,
+    http_models.Get, http_models.Delete, http_models.Incr, http_models.FiFoLiFoDelete,
+    http_models.FiFoLiFoPush, http_models.FiFoLiFoPop, http_models.FiFoLiFoCreate,
+)
+
+
+def _describe(model: type, field: str) -> str | None:
+    """
+    Looks up the description of a field on the model or the class that declares it.
+
+    Parameters:
+    model (type): The request model.
+    field (str): The name of the field.
+
+    Returns:
+    str | None: The description, or None if there is none.
+    """
+    for cls in model.__mro__:
+        description = DESCRIPTIONS.get(f"{cls.__name__}.{field}")
+        if description is not None:
+            return description
+    return None
+
+
+def components(models: Iterable[type] = MODELS,
+               ref_template: str = "#/components/schemas/{name}") -> Dict[str, Any]:
+    """
+    Generates the JSON (OpenAPI) schemas of the request models with their field descriptions.
+
+    Parameters:
+    models (Iterable[type]): The request models to generate schemas for. Defaults to all of them.
+    ref_template (str): The template of the references between schemas.
+
+    Returns:
+    Dict[str, Any]: The schemas by model name, e.g. for an OpenAPI "components/schemas" section.
+    """
+    models = tuple(models)
+    _, schemas = schema_components(models, ref_template=ref_template)
+    by_name = {model.__name__: model for model in models}
+    for name, schema in schemas.items():
+        model = by_name.get(name)
+        if model is None:
+            continue
+        for field, prop in schema.get("properties", {}).items():
+            description = _describe(model, field)
+            if description is not None:
+                prop["description"] = description
+    return schemas